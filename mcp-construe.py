@@ -17,23 +17,48 @@ mcp = FastMCP("Construe")
 # Global configuration storage
 _config = None
 _config_path = None
+_vault_path = None
 
 
 def load_config() -> Dict[str, Any]:
     """Load configuration with caching."""
-    global _config, _config_path
-    
+    global _config, _config_path, _vault_path
+
     if _config is not None:
         return _config
-    
+
     if _config_path is None:
         script_dir = Path(__file__).parent
         _config_path = script_dir / "config.yaml"
-    
+
     _config = obsidian_utils.load_config(_config_path)
+    # Resolve the vault path once; resolve() walks the whole path with
+    # lstat calls, which is pure waste on every tool invocation
+    _vault_path = Path(_config['vault_path']).expanduser().resolve()
     return _config
 
 
+def get_vault_path() -> Path:
+    """Return the resolved vault path, loading config if needed."""
+    if _vault_path is None:
+        load_config()
+    return _vault_path
+
+
+def check_vault_path(vault_path: Path) -> str:
+    """
+    Validate the vault path, returning an error message or empty string.
+
+    A single is_dir() stat covers the happy path; the exists() check only
+    runs when something is wrong, to pick the right message.
+    """
+    if vault_path.is_dir():
+        return ""
+    if not vault_path.exists():
+        return f"Error: Vault path does not exist: {vault_path}"
+    return f"Error: Vault path is not a directory: {vault_path}"
+
+
 @mcp.tool(
     name="fetch_context",
     description="Load context files from Obsidian vault by context type - specify 'personal', 'work', or any custom context",
@@ -55,23 +80,19 @@ def fetch_context(context_type: str) -> str:
         Concatenated content of all files matching the context type
     """
     try:
-        config = load_config()
-        vault_path = Path(config['vault_path']).expanduser().resolve()
-        
-        if not vault_path.exists():
-            return f"Error: Vault path does not exist: {vault_path}"
-        
-        if not vault_path.is_dir():
-            return f"Error: Vault path is not a directory: {vault_path}"
-        
-        # Use the context_type parameter to filter by context property
-        properties = {"context": context_type}
-        tags = []
+        vault_path = get_vault_path()
+
+        error = check_vault_path(vault_path)
+        if error:
+            return error
+
         context="""---
         Read and understand. When you are ready, simple acknowledge with a concise statement like "Ready to proceed."
         Wait for further instructions.
         ---"""
-        matching_files = obsidian_utils.find_matching_files(vault_path, properties, tags)
+        # Single-property context queries go straight to the inverted index
+        matching_paths = obsidian_utils.find_by_context(vault_path, context_type)
+        matching_files = obsidian_utils.iter_file_contents(matching_paths)
         context+=obsidian_utils.concatenate_files(matching_files)
 
         return context
@@ -107,19 +128,16 @@ def fetch_matching_files(
         Concatenated content of all matching files, sorted by modification date
     """
     try:
-        config = load_config()
-        vault_path = Path(config['vault_path']).expanduser().resolve()
-        
-        if not vault_path.exists():
-            return f"Error: Vault path does not exist: {vault_path}"
-        
-        if not vault_path.is_dir():
-            return f"Error: Vault path is not a directory: {vault_path}"
-        
+        vault_path = get_vault_path()
+
+        error = check_vault_path(vault_path)
+        if error:
+            return error
+
         properties = properties or {}
         tags = tags or []
         
-        matching_files = obsidian_utils.find_matching_files(vault_path, properties, tags, match_all_tags)
+        matching_files = obsidian_utils.iter_matching_files(vault_path, properties, tags, match_all_tags)
         context=obsidian_utils.concatenate_files(matching_files)
         context=context + """---
         Read and understand. Whenyou are ready, simple acknowledge with "Ready to proceed."
@@ -140,8 +158,8 @@ def get_vault_info() -> Dict[str, Any]:
     """
     try:
         config = load_config()
-        vault_path = Path(config['vault_path']).expanduser().resolve()
-        
+        vault_path = get_vault_path()
+
         info = obsidian_utils.get_vault_info(vault_path)
         if "error" not in info:
             info["default_context"] = config.get('default_context', {})
@@ -5,11 +5,69 @@ This module provides functions for extracting frontmatter, searching files,
 and concatenating content from Obsidian vaults based on properties and tags.
 """
 
+import datetime
+import heapq
+import json
+import mmap
+import os
 import re
+import sqlite3
+import threading
 import yaml
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+def _load_yaml(stream) -> Any:
+    """
+    Parse a single YAML document with safe_load semantics.
+
+    Uses libyaml's CSafeLoader when available; PyYAML builds a fresh
+    loader per call, which is what makes this safe from the threaded
+    scan path. (ruamel.yaml was dropped here: its default YAML 1.2
+    semantics parse yes/no/on/off as strings, silently diverging from
+    the 1.1 behaviour the rest of this module is tuned to.)
+    """
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+_YAML_ERRORS = (yaml.YAMLError,)
+
+try:
+    # JSON frontmatter (a '{...}' block between the fences, still valid
+    # YAML) gets the much faster orjson parser when available
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Cap on how many bytes of a file we read when only the frontmatter is needed.
+# Obsidian frontmatter is small; anything past this is treated as having none.
+_FRONTMATTER_CAP = 8192
+_FRONTMATTER_CHUNK = 4096
+
+# Files at least this large are memory-mapped rather than read in chunks,
+# so the delimiter search runs straight against the page cache
+_MMAP_THRESHOLD = 16384
+
+# Frontmatter block at the start of a file, compiled once at import
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+# Closing frontmatter delimiter, searched on raw bytes during streaming reads
+_FRONTMATTER_END_RE = re.compile(rb'\n---\s*\n')
+
+# Default location for the persistent frontmatter index
+_DEFAULT_INDEX_PATH = Path("~/.cache/construe/index.sqlite")
+
+# Thread count for overlapping file reads; the GIL is released during
+# read() syscalls, so threads help even though YAML parsing is CPU-bound
+_READ_THREADS = 32
 
 
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
@@ -34,11 +92,176 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    except yaml.YAMLError as e:
+            return _load_yaml(f)
+    except _YAML_ERRORS as e:
         raise yaml.YAMLError(f"Error parsing config.yaml: {e}")
 
 
+# Sentinel returned by _coerce_scalar for tokens the mini parser won't handle
+_BAIL = object()
+
+# Tokens PyYAML would resolve to dates/timestamps; leave those to YAML
+_DATE_LIKE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# PyYAML's exact case-sensitive bool/null token sets; anything else
+# ('None', 'yEs', ...) stays a plain string, just as safe_load leaves it
+_TRUE_TOKENS = {'true', 'True', 'TRUE', 'yes', 'Yes', 'YES', 'on', 'On', 'ON'}
+_FALSE_TOKENS = {'false', 'False', 'FALSE', 'no', 'No', 'NO', 'off', 'Off', 'OFF'}
+_NULL_TOKENS = {'~', 'null', 'Null', 'NULL'}
+
+# Leading characters that signal flow/block syntax a scalar token can't be
+_COMPLEX_LEAD_CHARS = '|>{[&*?'
+
+# PyYAML's YAML 1.1 int/float resolver grammars (yaml/resolver.py). A token
+# matching one of these but not the plain-decimal subset below (octal,
+# hex, binary, sexagesimal, .inf/.nan) bails to the real parser, which
+# knows how to evaluate it; a token matching neither stays a string, even
+# where Python's int()/float() would accept it ('1e5', 'nan', 'Infinity').
+_YAML_INT_RE = re.compile(r'''^(?:[-+]?0b[0-1_]+
+                               |[-+]?0[0-7_]+
+                               |[-+]?(?:0|[1-9][0-9_]*)
+                               |[-+]?0x[0-9a-fA-F_]+
+                               |[-+]?[1-9][0-9_]*(?::[0-5]?[0-9])+)$''', re.X)
+_YAML_FLOAT_RE = re.compile(r'''^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+][0-9]+)?
+                                 |\.[0-9_]+(?:[eE][-+][0-9]+)?
+                                 |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\.[0-9_]*
+                                 |[-+]?\.(?:inf|Inf|INF)
+                                 |\.(?:nan|NaN|NAN))$''', re.X)
+_PLAIN_INT_RE = re.compile(r'[-+]?(?:0|[1-9][0-9_]*)$')
+_PLAIN_FLOAT_RE = re.compile(r'''(?:[-+]?[0-9][0-9_]*\.[0-9_]*
+                                  |\.[0-9_]+)(?:[eE][-+][0-9]+)?$''', re.X)
+
+
+def _coerce_scalar(token: str):
+    """
+    Convert a plain YAML scalar token the way safe_load would.
+
+    Returns _BAIL for anything outside the simple subset (comments,
+    embedded quotes, dates, nested syntax) so the caller can fall back
+    to the real YAML parser.
+    """
+    if not token:
+        return _BAIL
+
+    if token[0] in '"\'':
+        if len(token) >= 2 and token[-1] == token[0]:
+            inner = token[1:-1]
+            if token[0] in inner or '\\' in inner:
+                return _BAIL
+            return inner
+        return _BAIL
+
+    if '#' in token or ': ' in token or token.endswith(':'):
+        return _BAIL
+    if _DATE_LIKE_RE.match(token):
+        return _BAIL
+
+    if token in _TRUE_TOKENS:
+        return True
+    if token in _FALSE_TOKENS:
+        return False
+    if token in _NULL_TOKENS:
+        return None
+
+    if _YAML_INT_RE.match(token):
+        if _PLAIN_INT_RE.match(token):
+            return int(token.replace('_', ''))
+        return _BAIL
+    if _YAML_FLOAT_RE.match(token):
+        if _PLAIN_FLOAT_RE.match(token):
+            return float(token.replace('_', ''))
+        return _BAIL
+
+    return token
+
+
+def _parse_simple_frontmatter(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the common flat-mapping subset of frontmatter without YAML.
+
+    Handles 'key: scalar', 'key: [a, b]' and block lists ('key:' followed
+    by indented '- item' lines) -- which covers the vast majority of
+    Obsidian notes. Returns None on anything more complex (nested
+    mappings, block scalars, anchors, ...) so the caller falls back to
+    the full YAML parser.
+
+    Args:
+        text: Frontmatter text between the '---' delimiters
+
+    Returns:
+        Parsed dictionary, or None if the text needs the real parser
+    """
+    result: Dict[str, Any] = {}
+    lines = text.split('\n')
+    total = len(lines)
+    i = 0
+
+    while i < total:
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped or stripped.startswith('#'):
+            i += 1
+            continue
+        if line[0] in ' \t' or ':' not in line:
+            return None
+
+        key, _, rest = line.partition(':')
+        key = key.strip()
+        if not key or any(c in key for c in '"\'{}[]#&*!|>%@`'):
+            return None
+
+        rest = rest.strip()
+
+        if rest == '':
+            # Either a block list or something nested; only accept the list
+            items = []
+            j = i + 1
+            while j < total and lines[j][:1] in (' ', '\t'):
+                item = lines[j].strip()
+                if item == '-':
+                    items.append(None)
+                elif item.startswith('- '):
+                    token = item[2:].strip()
+                    # Nested flow/block syntax inside a list item needs YAML
+                    if token and token[0] in _COMPLEX_LEAD_CHARS:
+                        return None
+                    value = _coerce_scalar(token)
+                    if value is _BAIL:
+                        return None
+                    items.append(value)
+                else:
+                    return None
+                j += 1
+            result[key] = items if items else None
+            i = j
+        elif rest.startswith('[') and rest.endswith(']'):
+            inner = rest[1:-1].strip()
+            if any(c in inner for c in '[]{}'):
+                return None
+            if not inner:
+                result[key] = []
+            else:
+                items = []
+                for part in inner.split(','):
+                    value = _coerce_scalar(part.strip())
+                    if value is _BAIL:
+                        return None
+                    items.append(value)
+                result[key] = items
+            i += 1
+        elif rest[0] in _COMPLEX_LEAD_CHARS:
+            return None
+        else:
+            value = _coerce_scalar(rest)
+            if value is _BAIL:
+                return None
+            result[key] = value
+            i += 1
+
+    return result
+
+
 def extract_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     """
     Extract YAML frontmatter from markdown content.
@@ -50,22 +273,162 @@ def extract_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
         Tuple of (frontmatter_dict, remaining_content)
         Returns empty dict if no valid frontmatter found
     """
-    pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.match(pattern, content, re.DOTALL)
-    
+    match = _FRONTMATTER_RE.match(content)
+
     if not match:
         return {}, content
     
     frontmatter_text = match.group(1)
     remaining_content = content[match.end():]
-    
+
+    stripped = frontmatter_text.lstrip()
+    if stripped.startswith('{'):
+        # JSON frontmatter convention: skip YAML entirely
+        try:
+            return _json_loads(stripped), remaining_content
+        except ValueError:
+            pass
+
+    frontmatter = _parse_simple_frontmatter(frontmatter_text)
+    if frontmatter is not None:
+        return frontmatter, remaining_content
+
     try:
-        frontmatter = yaml.safe_load(frontmatter_text) or {}
+        frontmatter = _load_yaml(frontmatter_text) or {}
         return frontmatter, remaining_content
-    except yaml.YAMLError:
+    except _YAML_ERRORS:
         return {}, content
 
 
+def _iter_markdown(vault_path: Path):
+    """
+    Yield os.DirEntry objects for every markdown file under vault_path.
+
+    Iterative os.scandir walk: reuses the metadata cached on each DirEntry
+    instead of allocating Path objects and re-stat-ing every entry the way
+    Path.rglob does.
+
+    Args:
+        vault_path: Path to Obsidian vault
+
+    Yields:
+        os.DirEntry for each .md file found
+    """
+    stack = [str(vault_path)]
+
+    while stack:
+        top = stack.pop()
+        try:
+            with os.scandir(top) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as e:
+            print(f"Warning: Could not scan {top}: {e}")
+
+
+def _read_frontmatter_head(file_path: Path) -> bytes:
+    """
+    Read just enough raw bytes of a file to cover its YAML frontmatter.
+
+    Reads the file in small binary chunks and stops as soon as the closing
+    '---' delimiter has been seen (or a byte cap is hit), so files that
+    won't match a query never get read in full.
+
+    Args:
+        file_path: Path to a markdown file
+
+    Returns:
+        The leading bytes of the file, through the closing delimiter
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+
+        if size >= _MMAP_THRESHOLD:
+            # Large file: search the mapping directly and copy out only the
+            # head slice, instead of pulling chunks into Python bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:3] != b'---':
+                    return mm[:3]
+                match = _FRONTMATTER_END_RE.search(mm, 3, _FRONTMATTER_CAP)
+                end = match.end() if match else min(size, _FRONTMATTER_CAP)
+                return mm[:end]
+
+        head = b''
+        while len(head) < _FRONTMATTER_CAP:
+            chunk = f.read(_FRONTMATTER_CHUNK)
+            if not chunk:
+                break
+            head += chunk
+            if not head.startswith(b'---'):
+                # No opening delimiter means no frontmatter; stop reading
+                break
+            if _FRONTMATTER_END_RE.search(head, 3):
+                break
+
+    return head
+
+
+def _read_frontmatter_only(file_path: Path) -> Dict[str, Any]:
+    """
+    Read just the frontmatter of a file and parse it.
+
+    Args:
+        file_path: Path to a markdown file
+
+    Returns:
+        Parsed frontmatter dictionary (empty if no valid frontmatter)
+    """
+    head = _read_frontmatter_head(file_path)
+    if not head.startswith(b'---'):
+        return {}
+
+    # Truncation can split a multibyte character; the match phase only needs
+    # the frontmatter keys, so a lossy decode of the tail is harmless.
+    frontmatter, _ = extract_frontmatter(head.decode('utf-8', errors='replace'))
+    return frontmatter
+
+
+def _compile_prefilters(properties: Dict[str, Any]) -> List['re.Pattern']:
+    """
+    Build byte-level regexes that cheaply reject files before YAML parsing.
+
+    A pattern may only reject a file when its head provably cannot match.
+    YAML offers too many ways to write 'key: value' (whitespace before the
+    colon, quoted keys, block scalars spilling onto following lines) for a
+    line-shape pattern to be safe, so each pattern just requires the key's
+    bytes to appear somewhere in the head -- a file that never mentions a
+    required key cannot have it in its frontmatter, and that alone rejects
+    the bulk of a vault without invoking YAML.
+
+    Args:
+        properties: Properties the query requires
+
+    Returns:
+        List of compiled bytes patterns (possibly empty)
+    """
+    return [
+        re.compile(re.escape(str(key).encode('utf-8')))
+        for key in properties
+    ]
+
+
+# Keys checked first in matches_criteria: these are the highly selective
+# properties in typical queries, so mismatches bail out early
+_SELECTIVE_KEYS = {'context': 0, 'status': 0}
+
+
+def _normalize_tags(file_tags: Any) -> List[str]:
+    """Coerce a frontmatter 'tags' value to a list of tags."""
+    if isinstance(file_tags, str):
+        return [file_tags]
+    if isinstance(file_tags, list):
+        return file_tags
+    return []
+
+
 def matches_criteria(
     frontmatter: Dict[str, Any], 
     properties: Dict[str, Any], 
@@ -84,91 +447,536 @@ def matches_criteria(
     Returns:
         True if file matches all criteria
     """
-    for key, value in properties.items():
-        if frontmatter.get(key) != value:
-            return False
-    
-    if tags:
-        file_tags = frontmatter.get('tags', [])
-        
-        if isinstance(file_tags, str):
-            file_tags = [file_tags]
-        elif not isinstance(file_tags, list):
-            file_tags = []
-        
-        if match_all_tags:
-            return all(tag in file_tags for tag in tags)
+    if properties:
+        items = properties.items()
+        if len(properties) > 1:
+            items = sorted(items, key=lambda kv: _SELECTIVE_KEYS.get(kv[0], 1))
+        for key, value in items:
+            if frontmatter.get(key) != value:
+                return False
+
+    if not tags:
+        return True
+
+    file_tags = frontmatter.get('tags', [])
+    if type(file_tags) is not list:
+        file_tags = [file_tags] if type(file_tags) is str else ()
+
+    if match_all_tags:
+        return all(tag in file_tags for tag in tags)
+    return any(tag in file_tags for tag in tags)
+
+
+def _json_default(obj: Any) -> str:
+    """
+    Serialize frontmatter values json.dumps can't handle natively.
+
+    YAML parses unquoted dates (the format Obsidian's Properties UI
+    writes) to datetime.date/datetime objects; store those as ISO strings
+    rather than aborting the whole index refresh.
+    """
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        return obj.isoformat()
+    return str(obj)
+
+
+class FrontmatterIndex:
+    """
+    Persistent frontmatter index keyed by (path, mtime, size).
+
+    Caches parsed frontmatter in SQLite so repeated queries only re-parse
+    files that have actually changed since the last refresh. Matching runs
+    against the in-memory dictionary and never touches unchanged files.
+
+    Safe to share across threads: MCP tool calls arrive on worker threads,
+    so the sqlite connection is opened with check_same_thread=False and a
+    lock serializes all access to the connection and in-memory maps.
+    """
+
+    def __init__(self, index_path: Optional[Path] = None):
+        self.index_path = (index_path or _DEFAULT_INDEX_PATH).expanduser()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._frontmatter: Dict[str, Dict[str, Any]] = {}
+        self._meta: Dict[str, Tuple[float, int]] = {}
+        # Inverted indexes: queries become set intersections/unions instead
+        # of a linear scan over every file's frontmatter
+        self._by_property: Dict[Tuple[str, Any], set] = {}
+        self._by_tag: Dict[str, set] = {}
+
+    def _index_file(self, path: str, frontmatter: Dict[str, Any]) -> None:
+        """Add one file's frontmatter to the inverted indexes."""
+        for key, value in frontmatter.items():
+            try:
+                self._by_property.setdefault((key, value), set()).add(path)
+            except TypeError:
+                # Unhashable value (list/dict); queries on it fall back to
+                # the linear scan
+                pass
+
+        for tag in _normalize_tags(frontmatter.get('tags', [])):
+            if isinstance(tag, str):
+                self._by_tag.setdefault(tag, set()).add(path)
+
+    def _unindex_file(self, path: str) -> None:
+        """Remove one file from the inverted indexes."""
+        frontmatter = self._frontmatter.get(path, {})
+
+        for key, value in frontmatter.items():
+            try:
+                self._by_property.get((key, value), set()).discard(path)
+            except TypeError:
+                pass
+
+        for tag in _normalize_tags(frontmatter.get('tags', [])):
+            if isinstance(tag, str):
+                self._by_tag.get(tag, set()).discard(path)
+
+    def load(self) -> None:
+        """Open (creating if needed) the index database and pull it into memory."""
+        with self._lock:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            # The lock serializes all use of the connection, so it can be
+            # created on one worker thread and used from another
+            self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, frontmatter BLOB)"
+            )
+            self._conn.commit()
+
+            for path, mtime, size, frontmatter in self._conn.execute(
+                "SELECT path, mtime, size, frontmatter FROM files"
+            ):
+                parsed = json.loads(frontmatter)
+                self._frontmatter[path] = parsed
+                self._meta[path] = (mtime, size)
+                self._index_file(path, parsed)
+
+    def refresh(self, vault_path: Path) -> None:
+        """
+        Bring the index up to date with the vault on disk.
+
+        Only files whose (mtime, size) differ from the cached values are
+        re-read; entries for deleted files are dropped.
+        """
+        with self._lock:
+            if self._conn is None:
+                self.load()
+
+            seen = set()
+
+            for entry in _iter_markdown(vault_path):
+                stat = entry.stat()
+                seen.add(entry.path)
+
+                if self._meta.get(entry.path) == (stat.st_mtime, stat.st_size):
+                    continue
+
+                try:
+                    frontmatter = _read_frontmatter_only(entry.path)
+                    serialized = json.dumps(frontmatter, default=_json_default)
+                except (IOError, UnicodeDecodeError, TypeError, ValueError) as e:
+                    print(f"Warning: Could not index {entry.path}: {e}")
+                    continue
+
+                self._unindex_file(entry.path)
+                self._frontmatter[entry.path] = frontmatter
+                self._meta[entry.path] = (stat.st_mtime, stat.st_size)
+                self._index_file(entry.path, frontmatter)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime, size, frontmatter) "
+                    "VALUES (?, ?, ?, ?)",
+                    (entry.path, stat.st_mtime, stat.st_size, serialized)
+                )
+
+            for stale in set(self._meta) - seen:
+                self._unindex_file(stale)
+                del self._frontmatter[stale]
+                del self._meta[stale]
+                self._conn.execute("DELETE FROM files WHERE path = ?", (stale,))
+
+            self._conn.commit()
+
+    def mtime(self, path: str) -> float:
+        """
+        Return the cached modification time for an indexed path.
+
+        Falls back to 0.0 if a concurrent refresh dropped the entry, so
+        such files simply sort first rather than raising.
+        """
+        with self._lock:
+            entry = self._meta.get(path)
+            return entry[0] if entry is not None else 0.0
+
+    def query(
+        self,
+        properties: Dict[str, Any],
+        tags: List[str],
+        match_all_tags: bool = False
+    ) -> List[str]:
+        """
+        Return paths of indexed files matching the criteria.
+
+        Args:
+            properties: Key-value pairs that must match (AND logic)
+            tags: List of tags to match
+            match_all_tags: If True, require ALL tags (AND), else ANY tags (OR)
+
+        Returns:
+            List of matching file paths (unsorted)
+        """
+        with self._lock:
+            return self._query_locked(properties, tags, match_all_tags)
+
+    def _query_locked(
+        self,
+        properties: Dict[str, Any],
+        tags: List[str],
+        match_all_tags: bool
+    ) -> List[str]:
+        candidates = None
+
+        for key, value in properties.items():
+            if value is None:
+                # matches_criteria treats None as "key absent", which the
+                # inverted index can't answer; use the linear scan
+                return self._query_linear(properties, tags, match_all_tags)
+            try:
+                paths = self._by_property.get((key, value), set())
+            except TypeError:
+                return self._query_linear(properties, tags, match_all_tags)
+
+            candidates = paths if candidates is None else candidates & paths
+            if not candidates:
+                return []
+
+        if tags:
+            tag_sets = [self._by_tag.get(tag, set()) for tag in tags]
+            tagged = set.intersection(*tag_sets) if match_all_tags else set.union(*tag_sets)
+            candidates = tagged if candidates is None else candidates & tagged
+
+        if candidates is None:
+            candidates = self._frontmatter.keys()
+
+        return list(candidates)
+
+    def _query_linear(
+        self,
+        properties: Dict[str, Any],
+        tags: List[str],
+        match_all_tags: bool
+    ) -> List[str]:
+        """Fallback linear scan for queries the inverted index can't serve."""
+        return [
+            path for path, frontmatter in self._frontmatter.items()
+            if matches_criteria(frontmatter, properties, tags, match_all_tags)
+        ]
+
+
+def _match_one(
+    path: str,
+    mtime: float,
+    properties: Dict[str, Any],
+    tags: List[str],
+    match_all_tags: bool,
+    prefilters: Optional[List['re.Pattern']] = None
+) -> Optional[Tuple[str, float]]:
+    """
+    Check a single file's frontmatter against the criteria without
+    reading its content.
+
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+
+    Args:
+        path: Path to a markdown file
+        mtime: Modification time captured during the directory scan
+        properties: Properties to match in frontmatter
+        tags: Tags to match
+        match_all_tags: Whether to require all tags vs any tags
+        prefilters: Byte-level patterns from _compile_prefilters; files
+            failing any pattern are rejected without YAML parsing
+
+    Returns:
+        (path, mtime) if the file matches, else None
+    """
+    try:
+        head = _read_frontmatter_head(path)
+
+        if head.startswith(b'---'):
+            if prefilters:
+                # Key-presence checks hold for JSON frontmatter too: the
+                # quoted key still contains the key's bytes
+                for pattern in prefilters:
+                    if not pattern.search(head):
+                        return None
+            frontmatter, _ = extract_frontmatter(head.decode('utf-8', errors='replace'))
         else:
-            return any(tag in file_tags for tag in tags)
-    
-    return True
+            # No opening delimiter: no frontmatter, so skip decode and parse
+            frontmatter = {}
+
+        if matches_criteria(frontmatter, properties, tags, match_all_tags):
+            return (path, mtime)
+
+    except (IOError, UnicodeDecodeError) as e:
+        print(f"Warning: Could not read {path}: {e}")
+
+    return None
+
+
+def _match_phase(
+    vault_path: Path,
+    properties: Dict[str, Any],
+    tags: List[str],
+    match_all_tags: bool,
+    workers: Optional[int],
+    index: Optional[FrontmatterIndex],
+    limit: Optional[int] = None
+) -> List[Tuple[str, float]]:
+    """
+    Run the metadata-only match pass over the vault.
+
+    Args:
+        limit: Keep only the N most recently modified matches; selected
+            with heapq.nlargest so the full list is never sorted
+
+    Returns:
+        List of (path, mtime) pairs for matching files, sorted by mtime
+    """
+    if index is not None:
+        index.refresh(vault_path)
+        matched = [
+            (path, index.mtime(path))
+            for path in index.query(properties, tags, match_all_tags)
+        ]
+        return _order_matches(matched, limit)
+
+    # Capture mtimes here, off the DirEntry stat cache; sorting later never
+    # re-stats a file
+    scan_list = [(entry.path, entry.stat().st_mtime) for entry in _iter_markdown(vault_path)]
+    prefilters = _compile_prefilters(properties)
+
+    if workers:
+        paths = [path for path, _ in scan_list]
+        mtimes = [mtime for _, mtime in scan_list]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # chunksize amortizes IPC overhead across many small files
+            results = executor.map(
+                _match_one, paths, mtimes,
+                repeat(properties), repeat(tags), repeat(match_all_tags),
+                repeat(prefilters),
+                chunksize=32
+            )
+            matched = [result for result in results if result is not None]
+    elif scan_list:
+        # Threads overlap the blocking read() syscalls so the kernel can
+        # schedule multiple read-ahead paths at once
+        with ThreadPoolExecutor(max_workers=min(_READ_THREADS, len(scan_list))) as executor:
+            futures = [
+                executor.submit(_match_one, path, mtime, properties, tags,
+                                match_all_tags, prefilters)
+                for path, mtime in scan_list
+            ]
+            matched = [
+                future.result() for future in as_completed(futures)
+                if future.result() is not None
+            ]
+    else:
+        matched = []
+
+    return _order_matches(matched, limit)
+
+
+def _order_matches(
+    matched: List[Tuple[str, float]],
+    limit: Optional[int]
+) -> List[Tuple[str, float]]:
+    """Sort (path, mtime) pairs by mtime, keeping only the newest N if limited."""
+    # Path breaks mtime ties so ordering stays deterministic regardless of
+    # which worker finished first
+    if limit is not None and limit < len(matched):
+        matched = heapq.nlargest(limit, matched, key=lambda x: (x[1], x[0]))
+        matched.reverse()
+        return matched
+
+    matched.sort(key=lambda x: (x[1], x[0]))
+    return matched
+
+
+def iter_file_contents(paths: Iterable[str]) -> Iterator[Tuple[Path, str]]:
+    """
+    Yield (path, content) for each readable file, one at a time.
+
+    Unreadable files are skipped with a warning, matching the scan
+    behaviour elsewhere in this module.
+
+    Args:
+        paths: Iterable of file paths
+
+    Yields:
+        (file_path, file_content) tuples in input order
+    """
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (IOError, UnicodeDecodeError) as e:
+            print(f"Warning: Could not read {path}: {e}")
+            continue
+        yield (Path(path), content)
+
+
+def iter_matching_files(
+    vault_path: Path,
+    properties: Dict[str, Any],
+    tags: List[str],
+    match_all_tags: bool = False,
+    workers: Optional[int] = None,
+    index: Optional[FrontmatterIndex] = None,
+    limit: Optional[int] = None
+) -> Iterator[Tuple[Path, str]]:
+    """
+    Yield matching markdown files one at a time in modification order.
+
+    The match pass touches only frontmatter and metadata; content is read
+    lazily as each file is yielded, so at most one file's content is held
+    on this generator's behalf at any time.
+
+    Args:
+        vault_path: Path to Obsidian vault
+        properties: Properties to match in frontmatter
+        tags: Tags to match
+        match_all_tags: Whether to require all tags vs any tags
+        workers: Number of worker processes for scanning. None (the
+            default) scans sequentially; try os.cpu_count() for large vaults
+        index: Optional FrontmatterIndex; when given, matching runs against
+            the cache and only changed files are re-parsed
+        limit: Only yield the N most recently modified matches; content is
+            never read for files outside the limit
+
+    Yields:
+        (file_path, file_content) tuples sorted by modification time
+    """
+    matched = _match_phase(vault_path, properties, tags, match_all_tags,
+                           workers, index, limit)
+    yield from iter_file_contents(path for path, _ in matched)
 
 
 def find_matching_files(
-    vault_path: Path, 
-    properties: Dict[str, Any], 
-    tags: List[str], 
-    match_all_tags: bool = False
+    vault_path: Path,
+    properties: Dict[str, Any],
+    tags: List[str],
+    match_all_tags: bool = False,
+    workers: Optional[int] = None,
+    index: Optional[FrontmatterIndex] = None,
+    limit: Optional[int] = None
 ) -> List[Tuple[Path, str]]:
     """
     Find all markdown files in vault that match the specified criteria.
-    
+
+    List-returning wrapper around iter_matching_files; prefer the
+    generator when streaming the results straight into concatenation.
+
     Args:
         vault_path: Path to Obsidian vault
         properties: Properties to match in frontmatter
         tags: Tags to match
         match_all_tags: Whether to require all tags vs any tags
-        
+        workers: Number of worker processes for scanning. None (the
+            default) scans sequentially; try os.cpu_count() for large vaults
+        index: Optional FrontmatterIndex; when given, matching runs against
+            the cache and only changed files are re-parsed
+        limit: Only return the N most recently modified matches; content is
+            never read for files outside the limit
+
     Returns:
         List of tuples (file_path, file_content) sorted by modification time
     """
-    matching_files = []
-    
-    for md_file in vault_path.rglob("*.md"):
-        if not md_file.is_file():
-            continue
-            
-        try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            frontmatter, _ = extract_frontmatter(content)
-            
-            if matches_criteria(frontmatter, properties, tags, match_all_tags):
-                matching_files.append((md_file, content))
-                
-        except (IOError, UnicodeDecodeError) as e:
-            print(f"Warning: Could not read {md_file}: {e}")
-            continue
-    
-    matching_files.sort(key=lambda x: x[0].stat().st_mtime)
-    return matching_files
+    return list(iter_matching_files(vault_path, properties, tags,
+                                    match_all_tags, workers, index, limit))
+
+
+# Shared index behind find_by_context, created on first use
+_context_index: Optional[FrontmatterIndex] = None
+_context_index_lock = threading.Lock()
+
+
+def find_by_context(vault_path: Path, context_type: str) -> List[Path]:
+    """
+    Fast lookup of files whose 'context' property equals context_type.
 
+    This is the hot path behind the fetch_context MCP tool: a single
+    known query shape, answered from the inverted index with no per-file
+    YAML parsing on cache hits.
 
-def concatenate_files(files: List[Tuple[Path, str]]) -> str:
+    Args:
+        vault_path: Path to Obsidian vault
+        context_type: Value the 'context' frontmatter property must equal
+
+    Returns:
+        List of matching file paths sorted by modification time
+    """
+    global _context_index
+
+    with _context_index_lock:
+        if _context_index is None:
+            index = FrontmatterIndex()
+            index.load()
+            _context_index = index
+        index = _context_index
+
+    index.refresh(vault_path)
+    paths = index.query({'context': context_type}, [])
+    return [
+        Path(path)
+        for path in sorted(paths, key=lambda p: (index.mtime(p), p))
+    ]
+
+
+def concatenate_files_iter(files: Iterable[Tuple[Path, str]]) -> Iterator[str]:
+    """
+    Yield the concatenated output one file-sized chunk at a time.
+
+    For transports that can stream, this keeps peak memory at roughly one
+    file's worth of text instead of the whole result.
+
+    Args:
+        files: Iterable of (file_path, content) tuples
+
+    Yields:
+        One formatted chunk (separators, path header, content) per file
+    """
+    separator = "=" * 80
+    for file_path, content in files:
+        # Paths come from a scan of the already-resolved vault root, so no
+        # per-file resolve() is needed
+        yield f"{separator}\n{file_path}\n{separator}\n{content}\n\n"
+
+
+def concatenate_files(files: Iterable[Tuple[Path, str]]) -> str:
     """
     Concatenate file contents with separator headers.
-    
+
+    Accepts any iterable, so results from iter_matching_files stream
+    straight into the output buffer without a list of contents ever
+    existing in memory.
+
     Args:
-        files: List of (file_path, content) tuples
-        
+        files: Iterable of (file_path, content) tuples
+
     Returns:
         Concatenated string with file separators
     """
-    if not files:
+    buf = bytearray()
+    for chunk in concatenate_files_iter(files):
+        buf += chunk.encode('utf-8')
+
+    if not buf:
         return "No matching files found."
-    
-    result_parts = []
-    
-    for file_path, content in files:
-        separator = "=" * 80
-        result_parts.append(separator)
-        result_parts.append(str(file_path.resolve()))
-        result_parts.append(separator)
-        result_parts.append(content)
-        result_parts.append("")
-    
-    return "\n".join(result_parts)
+
+    # Drop the trailing newline so output matches the old join behaviour
+    del buf[-1:]
+    return buf.decode('utf-8')
 
 
 def get_vault_info(vault_path: Path) -> Dict[str, Any]:
@@ -184,13 +992,13 @@ def get_vault_info(vault_path: Path) -> Dict[str, Any]:
     if not vault_path.exists():
         return {"error": "Vault path does not exist"}
     
-    md_files = list(vault_path.rglob("*.md"))
-    
+    md_count = sum(1 for _ in _iter_markdown(vault_path))
+
     return {
         "vault_path": str(vault_path),
         "exists": vault_path.exists(),
         "is_directory": vault_path.is_dir(),
-        "markdown_files_count": len(md_files)
+        "markdown_files_count": md_count
     }
 
 
@@ -280,15 +1088,15 @@ def main():
             
             tags = args.tag or []
         
-        # Find matching files
-        matching_files = find_matching_files(vault_path, properties, tags, args.all_tags)
-        
         # Output results
         if args.dry_run:
+            matching_files = find_matching_files(vault_path, properties, tags, args.all_tags)
             print(f"Found {len(matching_files)} matching files:")
             for file_path, _ in matching_files:
                 print(f"  {file_path}")
         else:
+            # Stream matches straight into the output buffer
+            matching_files = iter_matching_files(vault_path, properties, tags, args.all_tags)
             result = concatenate_files(matching_files)
             print(result)
         